@@ -4,12 +4,37 @@ This module contains all configuration settings for the Task Manager application
 including database URLs, Celery settings, and environment-specific configurations.
 """
 
+import importlib.util
 import os
+from functools import cached_property, lru_cache
+from typing import Optional
+
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
-from app.log.custom_logger import custom_logger as logger
+from app.log.custom_logger import configure_logging, custom_logger as logger
+
+_DOTENV_LOADED = False
 
-load_dotenv()
+# Written by scripts/compile_env.py; kept outside the app package so it is
+# never copied into the Docker image
+ENV_COMPILED_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    ".env_compiled.py",
+)
+
+
+def _load_compiled_env():
+    """Load the variables written by ``scripts/compile_env.py``.
+
+    Returns:
+        dict[str, str]: Pre-parsed .env values, or None if the file doesn't exist
+    """
+    if not os.path.exists(ENV_COMPILED_PATH):
+        return None
+    spec = importlib.util.spec_from_file_location("env_compiled", ENV_COMPILED_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.ENV
 
 
 class Settings(BaseSettings):
@@ -22,22 +47,72 @@ class Settings(BaseSettings):
     DESCRIPTION: str = "API for task management with delayed execution"
     VERSION: str = "1.0.0"
     DEBUG: bool = True
+    LOG_JSON: bool = False  # emit JSON records on stdout for log shippers
+
+    # Resolved by pydantic-settings from the environment / .env on construction;
+    # a missing required URL fails fast with a ValidationError naming the field
+    DATABASE_URL: str
+    REDIS_URL: Optional[str] = None
+    CELERY_BROKER_URL: str
+    CELERY_RESULT_BACKEND: str
 
-    DATABASE_URL: str = os.getenv("DATABASE_URL")
-    REDIS_URL: str = os.getenv("REDIS_URL")
-    CELERY_BROKER_URL: str = os.getenv("CELERY_BROKER_URL")
-    CELERY_RESULT_BACKEND: str = os.getenv("CELERY_RESULT_BACKEND")
+    # Connection pools (per process)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    CELERY_DB_POOL_SIZE: int = 4
+    CELERY_DB_MAX_OVERFLOW: int = 8
+    # Set when DATABASE_URL points at PgBouncer in transaction pooling mode
+    DB_PGBOUNCER: bool = False
 
-    BASE_DIR: str = os.path.dirname(os.path.abspath(__file__))
+    @cached_property
+    def BASE_DIR(self) -> str:
+        """Directory of the core package, computed on first access."""
+        return os.path.dirname(os.path.abspath(__file__))
 
     class Config:
         """Pydantic configuration for settings."""
         env_file = ".env"
 
-# Global settings instance
-try:
-    settings = Settings()
-    logger.info(f"[Config] Loaded settings for {settings.PROJECT_NAME} v{settings.VERSION}")
-except Exception as exc:
-    logger.critical(f"[Config] Error loading settings: {exc}")
-    raise
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the settings instance once per process.
+
+    The ``.env`` file is read on the first call only; later calls return
+    the cached instance. If ``backend/.env_compiled.py`` exists (see
+    ``scripts/compile_env.py``) its values are used instead of parsing ``.env``.
+
+    Returns:
+        Settings: Application settings
+    """
+    global _DOTENV_LOADED  # pylint: disable=global-statement
+    settings_kwargs = {}
+    if not _DOTENV_LOADED:
+        compiled_env = _load_compiled_env()
+        if compiled_env is None:
+            load_dotenv(override=False)
+        else:
+            logger.warning(
+                f"[Config] Using compiled environment {ENV_COMPILED_PATH}; .env is not read "
+                "until it is regenerated or deleted"
+            )
+            # Pre-parsed by scripts/compile_env.py; real environment still wins
+            for key, value in compiled_env.items():
+                os.environ.setdefault(key, value)
+            settings_kwargs["_env_file"] = None
+        _DOTENV_LOADED = True
+    try:
+        loaded = Settings(**settings_kwargs)
+    except Exception as exc:
+        logger.critical(f"[Config] Error loading settings: {exc}")
+        raise
+    configure_logging(loaded)
+    logger.info(f"[Config] Loaded settings for {loaded.PROJECT_NAME} v{loaded.VERSION}")
+    return loaded
+
+
+def __getattr__(name: str):
+    """Resolve the legacy module-level ``settings`` attribute lazily."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -17,6 +17,7 @@ def setup_middlewares(app: FastAPI):
         CORSMiddleware,
         allow_origins=["http://localhost:4200", "http://frontend:4200"],
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=["GET", "POST", "PUT", "DELETE"],
+        allow_headers=["authorization", "content-type"],
+        max_age=86400,  # let browsers cache preflight responses for 24h
     )
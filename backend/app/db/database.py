@@ -5,25 +5,80 @@ FastAPI and Celery workers, with proper cleanup and isolation.
 """
 
 from contextlib import asynccontextmanager
+from uuid import uuid4
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, AsyncEngine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, async_sessionmaker
+from sqlalchemy.orm import DeclarativeBase
 
-from app.core.config import settings
+from app.core.config import get_settings
 from app.log.custom_logger import custom_logger as logger
 
+settings = get_settings()
+
 # === Base class for SQLAlchemy models ===
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """Declarative base class for SQLAlchemy models."""
+
+# === SQLite tuning (local development database) ===
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply SQLITE_PRAGMAS to every new SQLite connection.
+
+    Args:
+        dbapi_connection: Raw DBAPI connection
+        connection_record: Pool record for the connection
+    """
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+def configure_sqlite(engine: AsyncEngine):
+    """Register SQLite pragmas on the engine; no-op for other backends.
+
+    Args:
+        engine: Async engine to configure
+    """
+    if engine.url.get_backend_name() == "sqlite":
+        event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+
+def _connect_args() -> dict:
+    """Driver options for the configured database.
+
+    Behind PgBouncer in transaction mode a connection may hop between server
+    sessions, so asyncpg must not cache or reuse named prepared statements.
+
+    Returns:
+        dict: ``connect_args`` for ``create_async_engine``
+    """
+    if settings.DB_PGBOUNCER and settings.DATABASE_URL.startswith("postgresql+asyncpg"):
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return {}
 
 # === Async session for FastAPI ===
 async_engine = create_async_engine(
     settings.DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
     pool_pre_ping=True,
+    connect_args=_connect_args(),
 )
+configure_sqlite(async_engine)
 
-AsyncSessionLocal = sessionmaker(
+AsyncSessionLocal = async_sessionmaker(
     bind=async_engine,
-    class_=AsyncSession,
     expire_on_commit=False,
 )
 
@@ -40,52 +95,46 @@ async def get_db_session():
             pass
 
 # === Async session for Celery ===
-def create_celery_engine() -> AsyncEngine:
-    """Create a new disposable async engine for Celery workers.
-    
-    Returns:
-        AsyncEngine: Fresh engine instance for single task use
-    """
-    return create_async_engine(
-        settings.DATABASE_URL,
-        pool_pre_ping=True,
-        poolclass=None,
-    )
+# Shared by every task in a worker process. Pooled connections are bound to the
+# event loop that opened them, so tasks must run on the worker's persistent loop
+# (see app.workers.loop) and each forked child must reset the inherited pool
+# (see app.workers.signals).
+celery_async_engine = create_async_engine(
+    settings.DATABASE_URL,
+    pool_size=settings.CELERY_DB_POOL_SIZE,
+    max_overflow=settings.CELERY_DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=300,
+    connect_args=_connect_args(),
+)
+configure_sqlite(celery_async_engine)
+
+CelerySessionFactory = async_sessionmaker(
+    bind=celery_async_engine,
+    expire_on_commit=False,
+)
 
 @asynccontextmanager
 async def get_celery_async_session_context():
-    """Async context manager for Celery database sessions with auto-disposal.
-    
+    """Async context manager for Celery database sessions.
+
     Yields:
         AsyncSession: Database session for Celery tasks
-        
+
     Note:
-        Engine is automatically disposed after task completion to prevent
-        event loop conflicts in prefork workers.
+        The session is closed on exit and its connection returned to the
+        shared pool; the engine itself is never disposed here.
     """
-    engine = create_celery_engine()
-    session_maker = sessionmaker(
-        bind=engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-    session = session_maker()
+    session = CelerySessionFactory()
     try:
         yield session
     finally:
         await session.close()
-        await engine.dispose()
 
-def get_celery_async_session() -> AsyncSession:
-    """Backward compatibility - creates session with shared engine.
-    
-    Returns:
-        AsyncSession: Database session
+def reset_celery_engine():
+    """Drop pooled connections inherited from a parent process.
+
+    Called in each forked worker child so it never reuses the parent's
+    sockets; new connections are opened lazily on first use.
     """
-    engine = create_celery_engine()
-    session_maker = sessionmaker(
-        bind=engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-    return session_maker()
+    celery_async_engine.sync_engine.dispose(close=False)
@@ -2,44 +2,345 @@
 
 This module configures structured logging with multiple outputs:
 file logging, error logging, and console output with colorization.
+All outputs share one bounded queue drained by a single background thread.
+Forked children (Celery prefork) write their own log files, so no file is
+ever shared between processes.
 """
 
+import atexit
+import calendar
+import os
+import queue
 import sys
+import threading
+import time
+import zipfile
 
 from loguru import logger
 
-handlers = [
-    {
-        "sink": "logs/.logfile.log",
-        "level": "TRACE",
-        "format": "[{time:YYYY-MM-DD HH:mm:ss} UTC] - [{level:7}] - [{name:10}:{line}] - {message}",
-        "colorize": False,
-        "rotation": "31 day",
-        "compression": "zip",
-        "enqueue": True,
-        "catch": True,
-    },
-    {
-        "sink": "logs/.errorfile.log",
-        "level": "WARNING",
-        "format": "[{time:YYYY-MM-DD HH:mm:ss} UTC] - [{level:7}] - [{name:10}:{line}] - {message}",
-        "colorize": False,
-        "rotation": "31 day",
-        "compression": "zip",
-        "enqueue": True,
-        "catch": True,
-    },
-    {
-        "sink": sys.stdout,
-        "level": "TRACE",
-        "format": "<level>[{time:YYYY-MM-DD HH:mm:ss} UTC] - [{level:7}] - [{name:10}:{line}] - {message}</level>",
-        "colorize": True,
-        "enqueue": True,
+BATCH_INTERVAL = 0.05  # seconds to wait for the first record of a batch
+BATCH_SIZE = 256  # max records written per batch
+QUEUE_SIZE = 10_000  # records beyond this are dropped
+ROTATION_SECONDS = 31 * 24 * 60 * 60
+
+FILE_FORMAT = "[{time:YYYY-MM-DD HH:mm:ss} UTC] - [{level:7}] - [{name:10}:{line}] - {message}"
+
+_log_queue = queue.Queue(maxsize=QUEUE_SIZE)
+_file_writers = {}
+_file_suffix = None  # set in forked children so they never share a file
+
+
+def _report_error(message: str):
+    """Report a logging failure on stderr, bypassing the logger itself."""
+    try:
+        sys.stderr.write(f"[Logger] {message}\n")
+        sys.stderr.flush()
+    except Exception:  # pylint: disable=broad-exception-caught
+        pass
+
+
+def _file_created_at(path: str) -> float:
+    """Return when a log file was started, from its first record's timestamp.
+
+    Filesystem times are no use here: Linux has no birth time and
+    ``st_ctime``/``st_mtime`` move on every append.
+
+    Args:
+        path: Log file path
+
+    Returns:
+        float: Unix timestamp of the first record, or now for an empty file
+    """
+    try:
+        with open(path, encoding="utf-8") as log_file:
+            first_line = log_file.readline(32)
+        return calendar.timegm(time.strptime(first_line[1:20], "%Y-%m-%d %H:%M:%S"))
+    except (OSError, ValueError):
+        return time.time()
+
+
+def _suffixed(path: str) -> str:
+    """Insert this process's file suffix (if any) before the extension.
+
+    Args:
+        path: Configured log file path
+
+    Returns:
+        str: Path this process writes to, e.g. ``logs/.logfile.worker-1.log``
+    """
+    if _file_suffix is None:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.{_file_suffix}{ext}"
+
+
+class FileWriter:
+    """Append-only log file with time based rotation and zip compression.
+
+    The file is rotated once it is ``ROTATION_SECONDS`` old, counted from
+    its first record rather than from process start.
+
+    Args:
+        path: Log file path (a per-process suffix is added in forked children)
+    """
+    def __init__(self, path: str):
+        self.base_path = path
+        self.path = path
+        self._file = None
+        self._created_at = 0.0
+        self._lock = threading.Lock()
+
+    def _open(self):
+        """Open the log file for appending, creating its directory if needed."""
+        self.path = _suffixed(self.base_path)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")  # pylint: disable=consider-using-with
+        self._created_at = _file_created_at(self.path)
+
+    def close(self):
+        """Close the file; the next write reopens it under the current suffix."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def reset_after_fork(self):
+        """Drop the lock and file handle inherited from the parent process."""
+        self._lock = threading.Lock()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _rotate(self):
+        """Move the current file aside as a zip archive and start a new one."""
+        self._file.close()
+        archive = f"{self.path}.{time.strftime('%Y-%m-%d_%H-%M-%S')}"
+        os.replace(self.path, archive)
+        with zipfile.ZipFile(f"{archive}.zip", "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.write(archive, os.path.basename(archive))
+        os.remove(archive)
+        self._open()
+
+    def write(self, chunk: str):
+        """Write a batch of formatted records with a single ``write()`` call."""
+        with self._lock:
+            if self._file is None:
+                self._open()
+            elif time.time() - self._created_at >= ROTATION_SECONDS:
+                self._rotate()
+            self._file.write(chunk)
+            self._file.flush()
+
+
+def _file_writer(path: str) -> FileWriter:
+    """Return the writer for a log file, creating it on first use.
+
+    Args:
+        path: Log file path
+
+    Returns:
+        FileWriter: Shared writer for ``path``
+    """
+    if path not in _file_writers:
+        _file_writers[path] = FileWriter(path)
+    return _file_writers[path]
+
+
+class StreamWriter:
+    """Writer for an already open text stream such as ``sys.stdout``.
+
+    Args:
+        stream: Text stream to write to
+    """
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, chunk: str):
+        """Write a batch of formatted records and flush the stream."""
+        self.stream.write(chunk)
+        self.stream.flush()
+
+
+class QueuedSink:
+    """Loguru sink that hands formatted records to the shared drain thread.
+
+    Records are dropped when the queue is full so a stalled writer never
+    blocks the caller or grows memory without bound.
+
+    Args:
+        writer: Destination the drain thread writes this sink's records to
+    """
+    def __init__(self, writer):
+        self.writer = writer
+
+    def __call__(self, message):
+        """Queue a formatted loguru message."""
+        try:
+            _log_queue.put_nowait((self.writer, str(message)))
+        except queue.Full:
+            pass
+
+
+def _drain_batch(block: bool) -> bool:
+    """Write up to ``BATCH_SIZE`` queued records, grouped per writer.
+
+    Args:
+        block: Wait up to ``BATCH_INTERVAL`` for the first record
+
+    Returns:
+        bool: True if any records were written
+    """
+    try:
+        item = _log_queue.get(timeout=BATCH_INTERVAL) if block else _log_queue.get_nowait()
+    except queue.Empty:
+        return False
+    batches = {}
+    writer, text = item
+    batches.setdefault(writer, []).append(text)
+    for _ in range(BATCH_SIZE - 1):
+        try:
+            writer, text = _log_queue.get_nowait()
+        except queue.Empty:
+            break
+        batches.setdefault(writer, []).append(text)
+    for writer, texts in batches.items():
+        _write(writer, "".join(texts))
+    return True
+
+
+def _write(writer, chunk: str):
+    """Write a chunk, reporting failures on stderr instead of raising.
+
+    Args:
+        writer: Destination writer
+        chunk: Formatted records
+    """
+    try:
+        writer.write(chunk)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        _report_error(f"Failed to write {len(chunk)} bytes of log records: {exc!r}")
+
+
+def _drain():
+    """Drain the log queue until the process exits."""
+    while True:
+        _drain_batch(block=True)
+
+
+def _flush():
+    """Write everything still queued; registered to run at exit."""
+    while _drain_batch(block=False):
+        pass
+
+
+def _start_drain_thread():
+    """Start the single background thread that writes queued records."""
+    threading.Thread(target=_drain, name="log-drain", daemon=True).start()
+
+
+def _after_fork():
+    """Give a forked child (Celery prefork) its own queue, drain thread and files.
+
+    The child writes to ``<name>.<pid>.log`` until ``set_file_suffix`` names
+    it more stably.
+    """
+    global _log_queue, _file_suffix  # pylint: disable=global-statement
+    _log_queue = queue.Queue(maxsize=QUEUE_SIZE)
+    _file_suffix = str(os.getpid())
+    for writer in _file_writers.values():
+        writer.reset_after_fork()
+    _start_drain_thread()
+
+
+def set_file_suffix(suffix: str):
+    """Write this process's log files under ``<name>.<suffix>.log``.
+
+    Celery children use their pool index, so a recycled child reuses its
+    predecessor's files instead of starting new ones.
+
+    Args:
+        suffix: Name part identifying this process
+    """
+    global _file_suffix  # pylint: disable=global-statement
+    _file_suffix = suffix
+    for writer in _file_writers.values():
+        writer.close()
+
+
+def _stdout_handler(log_json: bool = False):
+    """Build the console handler, colorized only when stdout is a terminal.
+
+    Args:
+        log_json: Emit serialized JSON records for log shippers
+
+    Returns:
+        dict: Loguru handler definition
+    """
+    handler = {
+        "sink": QueuedSink(StreamWriter(sys.stdout)),
+        "level": "INFO",
         "catch": True,
     }
-]
+    if log_json:
+        handler.update(format="{message}", serialize=True, colorize=False)
+    elif sys.stdout.isatty():
+        handler.update(format=f"<level>{FILE_FORMAT}</level>", colorize=True)
+    else:
+        handler.update(format=FILE_FORMAT, colorize=False)
+    return handler
+
 
-logger.configure(handlers=handlers)
+def _build_handlers(debug: bool = True, log_json: bool = False):
+    """Create the handler configuration for the global logger.
+
+    Args:
+        debug: Write TRACE records to the main log file
+        log_json: Emit JSON records on stdout
+
+    Returns:
+        list[dict]: Loguru handler definitions
+    """
+    return [
+        {
+            "sink": QueuedSink(_file_writer("logs/.logfile.log")),
+            "level": "TRACE" if debug else "DEBUG",
+            "format": FILE_FORMAT,
+            "colorize": False,
+            "catch": True,
+        },
+        {
+            "sink": QueuedSink(_file_writer("logs/.errorfile.log")),
+            "level": "WARNING",
+            "format": FILE_FORMAT,
+            "colorize": False,
+            "catch": True,
+        },
+        _stdout_handler(log_json),
+    ]
+
+
+# The module can be imported under more than one name (``app.log`` and ``log``
+# when PYTHONPATH points at ``app/``); configure the global logger only once.
+if not getattr(logger, "_configured", False):
+    logger.configure(handlers=_build_handlers())
+    logger._configured = True
+    logger._build_handlers = _build_handlers  # sinks bound to this copy's drain thread
+    _start_drain_thread()
+    atexit.register(_flush)
+    os.register_at_fork(after_in_child=_after_fork)
+
+
+def configure_logging(settings):
+    """Re-apply the handlers with options taken from the loaded settings.
+
+    Until this is called (from ``get_settings()``) the handlers use the
+    ``Settings`` defaults.
+
+    Args:
+        settings: Application settings
+    """
+    build_handlers = getattr(logger, "_build_handlers", _build_handlers)
+    logger.configure(handlers=build_handlers(debug=settings.DEBUG, log_json=settings.LOG_JSON))
 
 def logger_test():
     """Test all logging levels to verify configuration.
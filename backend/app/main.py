@@ -4,25 +4,87 @@ This module creates and configures the FastAPI application with
 async database initialization, middleware setup, and route registration.
 """
 
+import asyncio
+import os
 from datetime import datetime
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateIndex
 
 from app.log.custom_logger import logger_test, custom_logger as logger
 from app.db.database import Base, AsyncSessionLocal, async_engine
 from app.routers.v1 import server, task
 from app.services.task_service import TaskService
-from app.core.config import settings
+from app.core.config import get_settings
 from app.core.ascii_art import ASCII_ART
 from app.core.middleware import setup_middlewares
+from app.workers.dispatcher import eta_dispatcher
+
+settings = get_settings()
 
 # --- Async database initialization ---
+def _sync_schema(sync_conn):
+    """Create missing tables, and indexes added to models since a table was created.
+
+    ``create_all`` skips existing tables entirely, so new indexes on an
+    existing table are created here individually with ``IF NOT EXISTS``:
+    when several replicas start at once, the ones that lose the race skip
+    the index instead of failing.
+
+    Args:
+        sync_conn: Synchronous connection provided by ``run_sync``
+
+    Returns:
+        list[str]: Names of the tables and indexes that were created
+    """
+    inspector = inspect(sync_conn)
+    existing = set(inspector.get_table_names())
+    missing = [table for table in Base.metadata.sorted_tables if table.name not in existing]
+    created = [table.name for table in missing]
+    if missing:
+        Base.metadata.create_all(sync_conn, tables=missing)
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing:
+            continue
+        present = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in present:
+                sync_conn.execute(CreateIndex(index, if_not_exists=True))
+                created.append(index.name)
+    return created
+
 async def init_db():
-    """Initialize database tables asynchronously."""
-    async with async_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    logger.info("[Startup] Database tables created")
+    """Initialize database tables and indexes asynchronously.
+
+    A single inspector pass short-circuits ``create_all`` on warm starts
+    where the schema already exists. The DDL runs in autocommit mode, since
+    PostgreSQL only builds indexes ``CONCURRENTLY`` (without locking out
+    writes to the table) outside a transaction block.
+    """
+    autocommit_engine = async_engine.execution_options(isolation_level="AUTOCOMMIT")
+    async with autocommit_engine.connect() as conn:
+        created = await conn.run_sync(_sync_schema)
+    if created:
+        logger.info(f"[Startup] Database schema objects created: {', '.join(created)}")
+    else:
+        logger.info("[Startup] Database schema up to date")
+
+async def warm_db_pool(connections: int = 4):
+    """Open pooled connections up front so early requests skip the connect cost.
+
+    Args:
+        connections: Number of connections to open concurrently
+    """
+    async def _warm():
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    pool = async_engine.pool
+    pool_size = pool.size() if hasattr(pool, "size") else 1
+    await asyncio.gather(*[_warm() for _ in range(min(pool_size, connections))])
 
 # --- FastAPI lifespan management ---
 @asynccontextmanager
@@ -36,12 +98,13 @@ async def lifespan(application: FastAPI):
         None: Control back to FastAPI during runtime
     """
     # --- startup ---
-    if settings.DEBUG:
+    if settings.DEBUG and os.getenv("RUN_LOGGER_TEST"):
         logger_test()
     logger.info(f"[Startup] {settings.PROJECT_NAME} {settings.VERSION} starting...")
 
     # Initialize database tables
     await init_db()
+    await warm_db_pool()
 
     # Mark overdue tasks as DONE
     async with AsyncSessionLocal() as db:
@@ -49,18 +112,22 @@ async def lifespan(application: FastAPI):
         updated_count = await service.mark_overdue_tasks_done()
         logger.info(f"[Startup] Marked {updated_count} overdue tasks as DONE")
 
+    await eta_dispatcher.start()
+
     logger.success(f"[Startup] Server started at {datetime.now()}\n{ASCII_ART}")
 
     yield  # FastAPI handles requests here
 
     # --- shutdown ---
     logger.info("[Shutdown] FastAPI server is stopping...")
+    await eta_dispatcher.stop()
 
 # --- FastAPI application initialization ---
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description=settings.DESCRIPTION,
     version=settings.VERSION,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -5,8 +5,11 @@ including the Task model and TaskStatus enum.
 """
 
 import enum
+from datetime import datetime
+from typing import Optional
 
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Text
+from sqlalchemy import String, DateTime, Enum, Text, Index
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 from app.db.database import Base
@@ -30,23 +33,41 @@ class Task(Base):
         short_description: Auto-generated short description
         description: Task description
         text: Detailed task content
-        due_date: When the task should be completed (required, indexed)
+        due_date: When the task should be completed (required)
         created_at: Timestamp when task was created
         updated_at: Timestamp when task was last updated
-        status: Current task status (PENDING/DONE, indexed)
+        status: Current task status (PENDING/DONE, indexed with due_date)
     """
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Serves status filtering (get_tasks_by_status); the overdue sweep
+        # uses the partial ix_task_due_open index below. Indexes are built
+        # CONCURRENTLY so adding one to a live table doesn't block writes
+        # (see app.main.init_db).
+        Index("ix_tasks_status_due_date", "status", "due_date", postgresql_concurrently=True),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    title = Column(String(255), nullable=False, index=True)
-    short_description = Column(Text, nullable=True)
-    description = Column(Text, nullable=True)
-    text = Column(Text, nullable=True)
-    due_date = Column(DateTime(timezone=True), nullable=False, index=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    status = Column(Enum(TaskStatus), default=TaskStatus.PENDING, nullable=False, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    title: Mapped[str] = mapped_column(String(255), index=True)
+    short_description: Mapped[Optional[str]] = mapped_column(Text)
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    text: Mapped[Optional[str]] = mapped_column(Text)
+    due_date: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+    status: Mapped[TaskStatus] = mapped_column(Enum(TaskStatus), default=TaskStatus.PENDING)
 
     def __repr__(self):
         """String representation of Task instance."""
         return f"<Task(id={self.id}, title='{self.title}', status='{self.status}')>"
+
+
+# Partial index covering only unfinished tasks, for the overdue sweep
+# (status != DONE AND due_date <= now)
+Index(
+    "ix_task_due_open",
+    Task.due_date,
+    postgresql_where=Task.status != TaskStatus.DONE,
+    sqlite_where=Task.status != TaskStatus.DONE,
+    postgresql_concurrently=True,
+)
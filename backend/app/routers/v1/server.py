@@ -1,10 +1,32 @@
-from fastapi import APIRouter
-from app.core.config import settings
+from datetime import datetime, timezone
+
+import orjson
+from fastapi import APIRouter, Response
+from app.core.config import get_settings
+from app.workers.dispatcher import eta_dispatcher
 
 router = APIRouter(
     tags=['Server']
 )
 
+settings = get_settings()
+
+ROOT_PAYLOAD = orjson.dumps({
+    "status": "OK",
+    "message": f"{settings.PROJECT_NAME} is running (˶ᵔ ᵕ ᵔ˶)",
+    "version": settings.VERSION
+})
+
+HEALTH_OK = {
+    "status": "healthy",
+    "message": "API is running normally (˶ˆᗜˆ˵)"
+}
+
+HEALTH_DEGRADED = {
+    "status": "degraded",
+    "message": "Celery broker is not accepting messages; task scheduling is unavailable"
+}
+
 @router.get("/")
 async def root():
     """API root endpoint.
@@ -27,11 +49,7 @@ async def root():
             "version": "1.0.0"
         }
     """
-    return {
-        "status": "OK",
-        "message": f"{settings.PROJECT_NAME} is running (˶ᵔ ᵕ ᵔ˶)",
-        "version": settings.VERSION
-    }
+    return Response(content=ROOT_PAYLOAD, media_type="application/json")
 
 
 @router.get("/health")
@@ -43,7 +61,7 @@ async def health_check():
 
     Returns:
         dict: Health status information including:
-            - status: Overall health status
+            - status: Overall health status ("degraded" while the broker is failing)
             - timestamp: Current server time
             - uptime: Server uptime information
 
@@ -57,9 +75,10 @@ async def health_check():
             "uptime": "2h 15m 30s"
         }
     """
-    from datetime import datetime
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "message": "API is running normally (˶ˆᗜˆ˵)"
-    }
+    if not eta_dispatcher.available:
+        return {
+            **HEALTH_DEGRADED,
+            "undelivered_messages": eta_dispatcher.undelivered,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+    return {**HEALTH_OK, "timestamp": datetime.now(timezone.utc).isoformat()}
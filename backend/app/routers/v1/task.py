@@ -4,16 +4,17 @@ This module provides REST API endpoints for task management,
 including creation, retrieval, updates, and deletion of tasks.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from typing import List
 from datetime import timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse
+from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse, TaskResponseList
 from app.db.database import get_db_session
 from app.services.task_service import TaskService
 from app.models.task import TaskStatus
 from app.workers.task import update_task_status_task, generate_short_description_task
+from app.workers.dispatcher import eta_dispatcher
 
 router = APIRouter(
     prefix='/task',
@@ -31,6 +32,29 @@ def get_task_service(db: AsyncSession = Depends(get_db_session)):
     """
     return TaskService(db)
 
+def ensure_dispatch_available():
+    """Reject writes that need a Celery message while the broker is failing.
+
+    Raises:
+        HTTPException: 503 if queued messages have not been delivered for a while
+    """
+    if not eta_dispatcher.available:
+        raise HTTPException(status_code=503, detail="Task scheduling is temporarily unavailable")
+
+def task_list_response(tasks):
+    """Serialize a list of tasks in a single validation/serialization pass.
+
+    Args:
+        tasks: Task instances
+
+    Returns:
+        Response: JSON response with the serialized tasks
+    """
+    return Response(
+        content=TaskResponseList.dump_json(TaskResponseList.validate_python(tasks)),
+        media_type="application/json",
+    )
+
 @router.get("/", response_model=List[TaskResponse])
 async def get_tasks(service: TaskService = Depends(get_task_service), skip: int = 0, limit: int = 100):
     """Get all tasks with pagination.
@@ -48,7 +72,7 @@ async def get_tasks(service: TaskService = Depends(get_task_service), skip: int
         GET /api/v1/task/?skip=0&limit=10
     """
     tasks = await service.get_tasks(skip, limit)
-    return tasks
+    return task_list_response(tasks)
 
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(task_id: int, service: TaskService = Depends(get_task_service)):
@@ -87,7 +111,8 @@ async def create_task(task: TaskCreate, service: TaskService = Depends(get_task_
     """Create a new task.
 
     Create a new task with the provided details. The task will be automatically
-    scheduled for status updates based on its due date.
+    scheduled for status updates based on its due date. Celery messages are
+    batched by the dispatcher so broker round-trips don't add to latency.
 
     Request Body (TaskCreate):
         title (str, required): Task title (1-255 characters)
@@ -99,6 +124,9 @@ async def create_task(task: TaskCreate, service: TaskService = Depends(get_task_
     Returns:
         TaskResponse: Created task with auto-generated ID and timestamps
 
+    Raises:
+        HTTPException: 503 if the Celery broker is unavailable
+
     Example:
         POST /api/v1/task/
         {
@@ -109,14 +137,15 @@ async def create_task(task: TaskCreate, service: TaskService = Depends(get_task_
             "status": "PENDING"
         }
     """
+    ensure_dispatch_available()
     db_task = await service.create_task(task)
 
     eta = db_task.due_date
     if eta.tzinfo is None:
         eta = eta.replace(tzinfo=timezone.utc)
 
-    update_task_status_task.apply_async(args=[db_task.id], eta=eta)
-    generate_short_description_task.delay(db_task.id)
+    eta_dispatcher.submit(update_task_status_task, db_task.id, eta=eta)
+    eta_dispatcher.submit(generate_short_description_task, db_task.id)
 
     return db_task
 
@@ -143,6 +172,7 @@ async def update_task(task_id: int, task_update: TaskUpdate, service: TaskServic
 
     Raises:
         HTTPException: 404 if task with given ID is not found
+        HTTPException: 503 if due_date changes while the Celery broker is unavailable
 
     Example:
         PUT /api/v1/task/123
@@ -152,6 +182,8 @@ async def update_task(task_id: int, task_update: TaskUpdate, service: TaskServic
             "status": "DONE"
         }
     """
+    if task_update.due_date:
+        ensure_dispatch_available()
     task = await service.update_task(task_id, task_update)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
@@ -160,7 +192,7 @@ async def update_task(task_id: int, task_update: TaskUpdate, service: TaskServic
         eta = task_update.due_date
         if eta.tzinfo is None:
             eta = eta.replace(tzinfo=timezone.utc)
-        update_task_status_task.apply_async(args=[task.id], eta=eta)
+        eta_dispatcher.submit(update_task_status_task, task.id, eta=eta)
 
     return task
 
@@ -211,4 +243,4 @@ async def get_tasks_by_status(status: TaskStatus, service: TaskService = Depends
         GET /api/v1/task/status/done
     """
     tasks = await service.get_tasks_by_status(status)
-    return tasks
\ No newline at end of file
+    return task_list_response(tasks)
\ No newline at end of file
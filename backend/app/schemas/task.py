@@ -7,7 +7,7 @@ including validation rules and field descriptions.
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from app.models.task import TaskStatus
 
@@ -57,6 +57,7 @@ class TaskResponse(BaseModel):
     due_date: datetime
     status: TaskStatus
 
-    class Config:
-        """Pydantic configuration for ORM mode."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+# Validates/serializes a whole list of tasks in one call; built once at import
+TaskResponseList = TypeAdapter(list[TaskResponse])
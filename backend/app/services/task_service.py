@@ -6,12 +6,45 @@ including creation, updates, deletion, and status management.
 
 from datetime import datetime, timezone
 
+from sqlalchemy import DateTime, Integer, bindparam, case, func, literal, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.models.task import Task, TaskStatus
 from app.schemas.task import TaskCreate, TaskUpdate
 
+
+# Overdue-task statements are built once; only the bound values change per call
+_NOW = bindparam("now", type_=DateTime(timezone=True))
+# DONE is rendered inline so the planner can match the partial ix_task_due_open
+# index predicate (status != 'DONE'); a bound parameter would hide it
+_OVERDUE = (
+    Task.status != literal(TaskStatus.DONE, Task.status.type, literal_execute=True),
+    Task.due_date <= _NOW,
+)
+
+_MARK_OVERDUE_PAGE_STMT = (
+    update(Task)
+    .where(Task.id.in_(
+        # No ORDER BY: updated rows leave the predicate, so each page can
+        # seek the partial ix_task_due_open index
+        select(Task.id)
+        .where(*_OVERDUE)
+        .limit(bindparam("batch_size", type_=Integer))
+    ))
+    .values(status=TaskStatus.DONE, updated_at=_NOW)
+    .returning(Task.id)
+    .execution_options(synchronize_session=False)
+)
+
+_MARK_DONE_IF_DUE_STMT = (
+    update(Task)
+    .where(Task.id == bindparam("task_id", type_=Integer), Task.due_date <= _NOW)
+    .values(status=TaskStatus.DONE)
+    .returning(Task.id)
+    .execution_options(synchronize_session=False)
+)
+
 class TaskService:
     """Service class for task operations.
 
@@ -48,9 +81,8 @@ class TaskService:
         Returns:
             Task: Task instance or None if not found
         """
-        result = await self.db.execute(select(Task).filter(Task.id == task_id))
-        task = result.scalar_one_or_none()
-        return task
+        # Served from the session's identity map when already loaded
+        return await self.db.get(Task, task_id)
 
     async def create_task(self, task_create: TaskCreate):
         """Create a new task.
@@ -87,6 +119,57 @@ class TaskService:
         await self.db.refresh(task)
         return task
 
+    async def mark_done_if_due(self, task_id: int):
+        """Mark a task as DONE if its due date has passed, in a single UPDATE.
+
+        The due date check happens in the UPDATE itself, so the common case
+        (the ETA message arriving on time) costs one round-trip. Only when
+        no row matches is the task looked up to tell "not due" from "missing".
+
+        Args:
+            task_id: ID of task to update
+
+        Returns:
+            bool: True if marked DONE, False if not yet due, None if not found
+        """
+        result = await self.db.execute(
+            _MARK_DONE_IF_DUE_STMT,
+            {"task_id": task_id, "now": datetime.now(timezone.utc)},
+        )
+        updated_id = result.scalar_one_or_none()
+        await self.db.commit()
+        if updated_id is not None:
+            return True
+        exists = await self.db.scalar(select(Task.id).where(Task.id == task_id))
+        return False if exists is not None else None
+
+    async def generate_short_description(self, task_id: int):
+        """Derive a task's short description from its text in a single UPDATE.
+
+        The first 100 characters of ``text`` followed by ``...`` (or a
+        placeholder when there is no text) are computed by the database and
+        returned, without loading the task.
+
+        Args:
+            task_id: ID of task to update
+
+        Returns:
+            str: Generated short description or None if the task was not found
+        """
+        result = await self.db.execute(
+            update(Task)
+            .where(Task.id == task_id)
+            .values(short_description=case(
+                (func.coalesce(Task.text, "") == "", "Lorem ipsum dolor sit amet"),
+                else_=func.substr(Task.text, 1, 100).concat("..."),
+            ))
+            .returning(Task.short_description)
+            .execution_options(synchronize_session=False)
+        )
+        short_description = result.scalar_one_or_none()
+        await self.db.commit()
+        return short_description
+
     async def delete_task(self, task_id: int):
         """Delete a task.
 
@@ -116,32 +199,41 @@ class TaskService:
         tasks = result.scalars().all()
         return tasks
 
-    async def get_due_tasks(self):
-        """Get tasks that are overdue (due date passed, status not DONE).
+    async def _mark_overdue_page(self, now_utc: datetime, batch_size: int):
+        """Mark up to ``batch_size`` overdue tasks as DONE and commit.
+
+        Args:
+            now_utc: Cut-off due date
+            batch_size: Maximum number of rows to update
 
         Returns:
-            list[Task]: List of overdue tasks
+            list[int]: IDs of the updated tasks
         """
-        now = datetime.now(timezone.utc)
         result = await self.db.execute(
-            select(Task).filter(Task.status != TaskStatus.DONE, Task.due_date <= now)
+            _MARK_OVERDUE_PAGE_STMT,
+            {"now": now_utc, "batch_size": batch_size},
         )
-        tasks = result.scalars().all()
-        return tasks
+        updated_ids = result.scalars().all()
+        await self.db.commit()
+        return updated_ids
 
-    async def mark_overdue_tasks_done(self):
+    async def mark_overdue_tasks_done(self, batch_size: int = 1000):
         """Mark all overdue tasks as DONE.
 
+        Updates the overdue rows ``batch_size`` at a time until none are
+        left, so each UPDATE, its transaction and the returned ids stay
+        bounded however large the backlog is.
+
+        Args:
+            batch_size: Maximum number of rows updated per statement
+
         Returns:
             int: Number of tasks marked as done
         """
         now_utc = datetime.now(timezone.utc)
-        result = await self.db.execute(
-            select(Task).filter(Task.status != TaskStatus.DONE, Task.due_date <= now_utc)
-        )
-        overdue_tasks = result.scalars().all()
-        for task in overdue_tasks:
-            task.status = TaskStatus.DONE
-        if overdue_tasks:
-            await self.db.commit()
-        return len(overdue_tasks)
+        total = 0
+        while True:
+            updated_ids = await self._mark_overdue_page(now_utc, batch_size)
+            total += len(updated_ids)
+            if len(updated_ids) < batch_size:
+                return total
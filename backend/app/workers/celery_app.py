@@ -6,9 +6,29 @@ including broker settings, task routing, and worker configuration.
 
 import os
 
+import orjson
 from celery import Celery
+from kombu.serialization import register
 
-from app.core.config import settings
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+def _orjson_dumps(obj) -> bytes:
+    """Encode a message body with orjson.
+
+    Args:
+        obj: Message body
+
+    Returns:
+        bytes: JSON encoded body (non-str dict keys are stringified like json)
+    """
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+# orjson produces plain JSON, so "json" messages are still accepted
+register('orjson', _orjson_dumps, orjson.loads, content_type='application/x-orjson')
 
 # Create celery directory for beat schedule
 celery_dir = os.path.join(settings.BASE_DIR, "celery")
@@ -20,20 +40,26 @@ celery_app = Celery(
     "taskmanager",
     broker=settings.CELERY_BROKER_URL,
     backend=settings.CELERY_RESULT_BACKEND,
-    include=['app.workers.task']
+    # signals registers the worker/beat lifecycle handlers
+    include=['app.workers.task', 'app.workers.signals']
 )
 
 # Configure Celery settings
 celery_app.conf.update(
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    task_serializer='orjson',
+    accept_content=['orjson', 'json'],
+    result_serializer='orjson',
+    result_accept_content=['orjson', 'json'],
     timezone='UTC',
     enable_utc=True,
     beat_schedule_filename=CELERYBEAT_SCHEDULE_PATH,
     task_track_started=True,
     task_time_limit=30 * 60,  # 30 minutes max
     task_soft_time_limit=25 * 60,  # 25 minutes soft limit
-    worker_prefetch_multiplier=1,  # Process one task at a time
-    worker_max_tasks_per_child=1000,  # Restart worker after 1000 tasks
+    # Tasks are short DB round-trips; prefetch a batch per broker fetch
+    worker_prefetch_multiplier=16,
+    # Ack after the task runs so messages held by a crashed worker are redelivered
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_max_tasks_per_child=10000,  # Recycle the process (and its DB pool) after 10k tasks
 )
@@ -0,0 +1,263 @@
+"""In-process batching of Celery task dispatches.
+
+Request handlers queue messages on an asyncio queue instead of talking to the
+broker themselves. A background coroutine collects up to ``BATCH_SIZE``
+messages (waiting at most ``BATCH_WINDOW`` seconds for a batch to fill) and
+publishes the batch from a worker thread over a single producer connection.
+
+Publishing uses its own broker connection that gives up after one connect
+attempt of at most ``CONNECT_TIMEOUT`` seconds, without Celery's publish
+retries. Messages that fail to publish are re-queued with exponential backoff
+rather than dropped. As soon as the broker connection fails the dispatcher
+reports itself unavailable, so the API can reject new work instead of
+accepting tasks it cannot schedule, until a retried message goes through.
+"""
+
+import asyncio
+
+from kombu.exceptions import OperationalError
+
+from app.workers.celery_app import celery_app
+from app.log.custom_logger import custom_logger as logger
+
+BATCH_SIZE = 100
+BATCH_WINDOW = 0.005  # seconds
+RETRY_DELAY = 0.5  # seconds before the first retry; doubled per attempt
+MAX_RETRY_DELAY = 10.0  # seconds
+CONNECT_TIMEOUT = 2.0  # seconds per broker connect or read
+STOP_TIMEOUT = 10.0  # seconds allowed for flushing on shutdown
+
+_STOP = object()
+_connection = None
+
+
+def _broker_connection():
+    """Return the publishing connection, creating it on first use.
+
+    Only the dispatcher thread uses it, one batch at a time.
+
+    Returns:
+        kombu.Connection: Connection that fails after a single short attempt
+    """
+    global _connection  # pylint: disable=global-statement
+    if _connection is None:
+        _connection = celery_app.connection_for_write(
+            connect_timeout=CONNECT_TIMEOUT,
+            transport_options={
+                "max_retries": 0,
+                "socket_connect_timeout": CONNECT_TIMEOUT,
+                "socket_timeout": CONNECT_TIMEOUT,
+            },
+        )
+    return _connection
+
+
+def _reset_connection():
+    """Discard the publishing connection after a broker error."""
+    global _connection  # pylint: disable=global-statement
+    if _connection is not None:
+        _connection.collect()
+        _connection = None
+
+
+def _publish(batch, on_broker_error=None):
+    """Send a batch of task messages over the publishing connection.
+
+    Results are ignored (nothing reads them), which also keeps Celery from
+    subscribing to the result backend on every send. A message that fails
+    on its own doesn't affect the rest of the batch, but a broker connection
+    error aborts the batch: every remaining message is returned as failed
+    without being tried.
+
+    Args:
+        batch: List of ``(task, args, options, attempt)`` tuples
+        on_broker_error: Called from this thread as soon as the broker fails
+
+    Returns:
+        list[tuple]: ``(message, exception)`` pairs for messages that failed
+    """
+    failed = []
+    connection = _broker_connection()
+    for index, message in enumerate(batch):
+        task, args, options, _ = message
+        try:
+            task.apply_async(
+                args=args, connection=connection, retry=False, ignore_result=True, **options
+            )
+        except OperationalError as exc:
+            _reset_connection()
+            if on_broker_error is not None:
+                on_broker_error()
+            failed.extend((pending, exc) for pending in batch[index:])
+            break
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            failed.append((message, exc))
+    return failed
+
+
+class EtaDispatcher:
+    """Coalesces Celery ``apply_async`` calls into batched broker writes.
+
+    Started and stopped from the FastAPI lifespan. When it is not running
+    (e.g. outside the app), ``submit`` sends the message immediately.
+    """
+    def __init__(self):
+        self._queue = None
+        self._runner = None
+        self._retrying = {}
+        self._in_flight = []
+        self._broker_down = False
+
+    @property
+    def available(self) -> bool:
+        """Whether the broker accepted the last publish attempt.
+
+        Returns:
+            bool: False from the first broker connection error until a send succeeds
+        """
+        return not self._broker_down
+
+    @property
+    def undelivered(self) -> int:
+        """Number of messages waiting to be retried.
+
+        Returns:
+            int: Messages whose last publish attempt failed
+        """
+        return len(self._retrying)
+
+    def submit(self, task, *args, **options):
+        """Queue ``task.apply_async(args=args, **options)`` for the next batch.
+
+        Args:
+            task: Celery task to send
+            *args: Positional task arguments
+            **options: ``apply_async`` options such as ``eta``
+        """
+        if self._runner is None:
+            task.apply_async(args=args, **options)
+            return
+        self._queue.put_nowait((task, args, options, 0))
+
+    async def start(self):
+        """Start the background batching coroutine."""
+        self._queue = asyncio.Queue()
+        self._runner = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Flush queued messages and stop the background coroutine.
+
+        Flushing is bounded by ``STOP_TIMEOUT``. Messages still waiting for a
+        retry get one last publish attempt if the broker is up; everything
+        that could not be sent is logged so it can be replayed by hand.
+        """
+        if self._runner is None:
+            return
+        self._queue.put_nowait(_STOP)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + STOP_TIMEOUT
+        try:
+            await asyncio.wait_for(self._runner, STOP_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.error(f"[Dispatcher] Flushing did not finish within {STOP_TIMEOUT:.0f}s")
+        self._runner = None
+        pending = list(self._in_flight)
+        self._in_flight = []
+        for handle, message in self._retrying.values():
+            handle.cancel()
+            pending.append(message)
+        self._retrying.clear()
+        while not self._queue.empty():
+            message = self._queue.get_nowait()
+            if message is not _STOP:
+                pending.append(message)
+        if not pending:
+            return
+        failed = [(message, "broker unavailable") for message in pending]
+        timeout = deadline - loop.time()
+        if not self._broker_down and timeout > 0:
+            try:
+                failed = await asyncio.wait_for(asyncio.to_thread(_publish, pending), timeout)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                failed = [(message, exc) for message in pending]
+        for (task, args, options, _), exc in failed:
+            logger.critical(f"[Dispatcher] Dropping {task.name}{args} {options} on shutdown: {exc}")
+
+    async def _next_batch(self):
+        """Collect the next batch of queued messages.
+
+        Returns:
+            tuple[list, bool]: Messages to publish and whether stop was requested
+        """
+        loop = asyncio.get_running_loop()
+        batch = []
+        item = await self._queue.get()
+        deadline = loop.time() + BATCH_WINDOW
+        while item is not _STOP:
+            batch.append(item)
+            if len(batch) >= BATCH_SIZE:
+                return batch, False
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                return batch, False
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                return batch, False
+        return batch, True
+
+    def _retry_later(self, message, exc):
+        """Re-queue a failed message after an exponential backoff.
+
+        Args:
+            message: ``(task, args, options, attempt)`` tuple that failed
+            exc: Exception raised while publishing it
+        """
+        task, args, options, attempt = message
+        delay = min(RETRY_DELAY * 2 ** attempt, MAX_RETRY_DELAY)
+        logger.warning(
+            f"[Dispatcher] Failed to send {task.name}{args} (attempt {attempt + 1}): {exc}; "
+            f"retrying in {delay:.1f}s"
+        )
+        retry = (task, args, options, attempt + 1)
+        handle = asyncio.get_running_loop().call_later(delay, self._requeue, retry)
+        self._retrying[id(retry)] = (handle, retry)
+
+    def _requeue(self, message):
+        """Put a message whose backoff expired back on the queue.
+
+        Args:
+            message: ``(task, args, options, attempt)`` tuple to resend
+        """
+        self._retrying.pop(id(message), None)
+        self._queue.put_nowait(message)
+
+    async def _run(self):
+        """Publish batches until ``stop`` is called."""
+        loop = asyncio.get_running_loop()
+        on_broker_error = lambda: loop.call_soon_threadsafe(self._mark_broker_down)  # pylint: disable=unnecessary-lambda-assignment
+        stopping = False
+        while not stopping:
+            batch, stopping = await self._next_batch()
+            if not batch:
+                continue
+            self._in_flight = batch
+            try:
+                failed = await asyncio.to_thread(_publish, batch, on_broker_error)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                failed = [(message, exc) for message in batch]
+            self._in_flight = []
+            if len(failed) < len(batch) and self._broker_down:
+                self._broker_down = False
+                logger.info("[Dispatcher] Broker accepting messages again")
+            for message, exc in failed:
+                self._retry_later(message, exc)
+
+    def _mark_broker_down(self):
+        """Report the dispatcher unavailable; runs on the loop as soon as a send fails."""
+        if not self._broker_down:
+            self._broker_down = True
+            logger.error("[Dispatcher] Broker connection failed, rejecting new work until it recovers")
+
+
+eta_dispatcher = EtaDispatcher()
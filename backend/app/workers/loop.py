@@ -0,0 +1,60 @@
+"""Per-process event loop for running async code from Celery.
+
+Celery tasks are synchronous; instead of creating and tearing down a new loop
+with ``asyncio.run()`` for every task, each worker process keeps one loop
+running forever in a daemon thread. Pooled database connections and the Redis
+client are bound to the loop that opened them, so they stay usable across
+tasks.
+"""
+
+import asyncio
+import threading
+
+RUN_TIMEOUT = 30 * 60  # seconds; matches Celery's task_time_limit
+
+_loop = None
+_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return this process's event loop, starting its thread on first use.
+
+    Returns:
+        asyncio.AbstractEventLoop: Running event loop
+    """
+    global _loop  # pylint: disable=global-statement
+    with _lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="async-loop", daemon=True).start()
+        return _loop
+
+
+def run_async(coro, timeout: float = RUN_TIMEOUT):
+    """Run a coroutine on this process's event loop and wait for the result.
+
+    Args:
+        coro: Coroutine to run
+        timeout: Seconds to wait before giving up
+
+    Returns:
+        Any: Result of the coroutine
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_loop())
+    try:
+        return future.result(timeout=timeout)
+    except BaseException:
+        # Timeouts and Celery time limits interrupt the wait, not the coroutine
+        future.cancel()
+        raise
+
+
+def reset_loop():
+    """Forget the loop inherited from a parent process after fork.
+
+    The parent's loop thread does not exist in the child, so a new loop and
+    thread are started on the next ``run_async`` call.
+    """
+    global _loop, _lock  # pylint: disable=global-statement
+    _lock = threading.Lock()
+    _loop = None
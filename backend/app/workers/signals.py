@@ -1,40 +1,29 @@
 """Celery signal handlers for worker lifecycle management.
 
-This module handles Celery worker signals to schedule overdue tasks
-when workers start up or beat scheduler initializes.
+Status updates are normally driven by the ETA message sent when a task is
+created or its due date changes. The startup sweep here is only a
+crash-recovery fallback for ETAs lost while no worker was running; it
+enqueues a single bulk UPDATE when workers start up or beat initializes.
 """
 
-import asyncio
+from celery.signals import worker_ready, beat_init, worker_process_init
+from celery.utils.log import current_process_index
 
-from celery.signals import worker_ready, beat_init
-
-from app.db.database import get_celery_async_session_context
-from app.services.task_service import TaskService
-from app.log.custom_logger import custom_logger as logger
-
-
-async def _schedule_due_tasks():
-    """Check tasks whose due_date has passed and enqueue them in Celery (async)"""
-    async with get_celery_async_session_context() as db:
-        service = TaskService(db)
-        due_tasks = await service.get_due_tasks()
-        if due_tasks:
-            from app.workers.task import update_task_status_task
-            for task in due_tasks:
-                logger.trace(f'Scheduling missed task {task.id} for status update')
-                update_task_status_task.delay(task.id)
-            logger.info(f"Scheduled {len(due_tasks)} overdue tasks for status update")
-        else:
-            logger.info("No overdue tasks to schedule")
+from app.db.database import reset_celery_engine
+from app.log.custom_logger import custom_logger as logger, set_file_suffix
+from app.workers.loop import reset_loop
 
 
 def schedule_due_tasks():
-    """Wrapper to run async schedule_due_tasks in sync context.
-    
-    This function bridges the sync Celery signal handlers with async database operations.
+    """Enqueue a single bulk sweep that marks every overdue task as DONE.
+
+    The UPDATE runs server-side inside one Celery task instead of one
+    ``update_task_status`` message, session and query per overdue task.
     """
     try:
-        asyncio.run(_schedule_due_tasks())
+        from app.workers.task import mark_overdue_bulk_task
+        mark_overdue_bulk_task.delay()
+        logger.info("Scheduled bulk status update for overdue tasks")
     except Exception as exc:  # pylint: disable=broad-exception-caught
         logger.error(f"[Celery Signals] Error scheduling due tasks: {exc}")
 
@@ -61,3 +50,21 @@ def on_beat_init(sender, **kwargs):
     """
     logger.info("[Celery Beat] Beat initialized, checking overdue tasks...")
     schedule_due_tasks()
+
+
+@worker_process_init.connect
+def on_worker_process_init(**kwargs):
+    """Signal handler for each forked worker child process.
+
+    Discards the event loop and pooled database connections inherited from
+    the parent so the child opens its own, and names the child's log files
+    after its pool index.
+
+    Args:
+        **kwargs: Additional signal arguments
+    """
+    index = current_process_index()
+    if index is not None:
+        set_file_suffix(f"worker-{index}")
+    reset_loop()
+    reset_celery_engine()
@@ -1,17 +1,14 @@
 """Celery task definitions for async task processing.
 
 This module defines Celery tasks that handle async operations
-using asyncio.run() to bridge sync Celery with async database operations.
+by running them on the worker process's persistent event loop.
 """
 
-import asyncio
-from datetime import datetime, timezone
-
 from app.workers.celery_app import celery_app
 from app.db.database import get_celery_async_session_context
 from app.services.task_service import TaskService
 from app.log.custom_logger import custom_logger as logger
-from app.models.task import TaskStatus
+from app.workers.loop import run_async
 
 
 async def _update_task_status(task_id: int):
@@ -25,22 +22,15 @@ async def _update_task_status(task_id: int):
     """
     async with get_celery_async_session_context() as db:
         service = TaskService(db)
-        task = await service.get_task(task_id)
-        if not task:
+        updated = await service.mark_done_if_due(task_id)
+        if updated is None:
             return {'error': f'Task {task_id} not found'}
 
-        now_utc = datetime.now(timezone.utc)
-        task_due = task.due_date
-        if task_due.tzinfo is None:
-            task_due = task_due.replace(tzinfo=timezone.utc)
-
-        if now_utc >= task_due:
-            task.status = TaskStatus.DONE
-            await db.commit()
-            logger.trace(f'Task {task_id} status updated to DONE')
+        if updated:
+            logger.trace('Task {} status updated to DONE', task_id)
             return {'success': f'Task {task_id} status updated to DONE'}
 
-        logger.trace(f'Task {task_id} due date not yet reached')
+        logger.trace('Task {} due date not yet reached', task_id)
         return {'success': f'Task {task_id} due date not yet reached'}
 
 
@@ -55,7 +45,7 @@ def update_task_status_task(self, task_id: int):
         str: Success or error message
     """
     try:
-        result = asyncio.run(_update_task_status(task_id))
+        result = run_async(_update_task_status(task_id))
         if 'error' in result:
             self.update_state(state='FAILURE', meta={'error': result['error']})
             return result['error']
@@ -77,15 +67,11 @@ async def _generate_short_description(task_id: int):
     """
     async with get_celery_async_session_context() as db:
         service = TaskService(db)
-        task = await service.get_task(task_id)
-        if not task:
+        short_description = await service.generate_short_description(task_id)
+        if short_description is None:
             return {'error': f'Task {task_id} not found'}
 
-        # Generate short description from task text
-        short_description = (task.text[:100] + "...") if task.text else "Lorem ipsum dolor sit amet"
-        task.short_description = short_description
-        await db.commit()
-        logger.trace(f'Short description generated for task {task_id}')
+        logger.trace('Short description generated for task {}', task_id)
         return {'success': f'Short description generated for task {task_id}: {short_description}'}
 
 
@@ -100,7 +86,7 @@ def generate_short_description_task(self, task_id: int):
         str: Success or error message
     """
     try:
-        result = asyncio.run(_generate_short_description(task_id))
+        result = run_async(_generate_short_description(task_id))
         if 'error' in result:
             self.update_state(state='FAILURE', meta={'error': result['error']})
             return result['error']
@@ -109,3 +95,35 @@ def generate_short_description_task(self, task_id: int):
         self.update_state(state='FAILURE', meta={'error': str(exc)})
         logger.critical(f'Error generating description for task {task_id}: {exc}')
         raise
+
+
+async def _mark_overdue_tasks():
+    """Async helper function to mark every overdue task as DONE.
+
+    Returns:
+        dict: Result with 'success' key
+    """
+    async with get_celery_async_session_context() as db:
+        service = TaskService(db)
+        updated_count = await service.mark_overdue_tasks_done()
+        return {'success': f'Marked {updated_count} overdue tasks as DONE'}
+
+
+@celery_app.task(bind=True, name='mark_overdue_bulk')
+def mark_overdue_bulk_task(self):
+    """Celery task to mark all overdue tasks as DONE with one bulk UPDATE.
+
+    Used by the worker/beat startup sweep instead of one
+    ``update_task_status`` message per overdue task.
+
+    Returns:
+        str: Success message
+    """
+    try:
+        result = run_async(_mark_overdue_tasks())
+        logger.info(result['success'])
+        return result['success']
+    except Exception as exc:
+        self.update_state(state='FAILURE', meta={'error': str(exc)})
+        logger.critical(f'Error marking overdue tasks: {exc}')
+        raise
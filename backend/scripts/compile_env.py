@@ -0,0 +1,29 @@
+"""Compile a .env file into an importable Python module.
+
+Run at deploy/build time so processes import a plain dict literal instead of
+parsing the .env file on every start:
+
+    python scripts/compile_env.py [path/to/.env]
+"""
+
+import os
+import sys
+
+from dotenv import dotenv_values
+
+# Outside the app package: the file holds secrets and must not end up in the image
+TARGET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".env_compiled.py")
+
+
+def main():
+    """Read the .env file and write ``backend/.env_compiled.py``."""
+    source = sys.argv[1] if len(sys.argv) > 1 else ".env"
+    values = {key: value for key, value in dotenv_values(source).items() if value is not None}
+    with open(TARGET, "w", encoding="utf-8") as fh:
+        fh.write('"""Generated by scripts/compile_env.py - do not edit."""\n\n')
+        fh.write(f"ENV: dict[str, str] = {values!r}\n")
+    print(f"Wrote {len(values)} variables from {source} to {os.path.normpath(TARGET)}")
+
+
+if __name__ == "__main__":
+    main()